@@ -1,8 +1,11 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, request, render_template, abort
 
-from automata.fa.dfa import DFA
+import sys
+import time
 from datetime import datetime
 
+import orjson
+
 app = Flask(__name__)
 
 # ---------------------------------------
@@ -10,52 +13,54 @@ app = Flask(__name__)
 # ---------------------------------------
 
 def dfa_validate_card_number(number):
-    # States: 0..19 = digit count, -1 = dead state
-    states = set(range(20)) | {-1}
-
-    # Alphabet: digits only
-    alphabet = set('0123456789') # {'0','1','2','3','4','5','6','7','8','9'}
-
-    # Transition function
-    transitions = {}
-
-    for state in range(20): # total 20 states q0 till q19
-        transitions[state] = {} # assign another dictionary
-        for d in alphabet:
-            transitions[state][d] = state + 1 if state < 19 else -1
-
-    # Dead state transitions
-    transitions[-1] = {d: -1 for d in alphabet}
-
-    # Create DFA
-    dfa = DFA(
-        states=states,
-        input_symbols=alphabet,
-        transitions=transitions,
-        initial_state=0,
-        final_states={13, 14, 15, 16, 17, 18, 19}
+    # Accepts exactly the language of the 20-state DFA (q0..q19, final
+    # states q13..q19): 13 to 19 ASCII digits. isascii() is a flag read on
+    # CPython strings and isdigit() scans in C, so no per-character Python
+    # loop is left; isascii() also keeps non-ASCII digits like '٤' out.
+    return (
+        isinstance(number, str)
+        and 13 <= len(number) <= 19
+        and number.isascii()
+        and number.isdigit()
     )
 
-    # Run DFA
-    return dfa.accepts_input(number)
-
 # ---------------------------------------
 # 2. DETECT CARD ISSUER
 # ---------------------------------------
+# Interned once so every result shares the same issuer string objects
+_VISA = sys.intern("Visa")
+_MASTERCARD = sys.intern("MasterCard")
+_AMEX = sys.intern("American Express")
+_DISCOVER = sys.intern("Discover")
+_UNKNOWN_ISSUER = sys.intern("Unknown")
+
+_ISSUER_LENGTHS = frozenset((13, 15, 16, 19))
+_MASTERCARD_PREFIXES = frozenset(("51", "52", "53", "54", "55"))
+_AMEX_PREFIXES = frozenset(("34", "37"))
+
 def detect_card_issuer(number):
-    number = str(number)
+    if not isinstance(number, str):
+        return _UNKNOWN_ISSUER
     length = len(number)
-    
-    if number.startswith("4") and (length == 13 or length == 16 or length == 19):
-        return "Visa"
-    elif number.startswith(("51", "52", "53", "54", "55")) and length == 16:
-        return "MasterCard"
-    elif number.startswith(("34", "37")) and length == 15:
-        return "American Express"
-    elif (number.startswith("6011") or number.startswith("65")) and length == 16:
-        return "Discover"
-    else:
-        return "Unknown"
+    # Reject impossible lengths before scanning the digits
+    if length not in _ISSUER_LENGTHS or not (number.isascii() and number.isdigit()):
+        return _UNKNOWN_ISSUER
+
+    # Branch on length first so each issuer costs one slice comparison
+    if length == 16:
+        if number[0] == "4":
+            return _VISA
+        if number[:2] in _MASTERCARD_PREFIXES:
+            return _MASTERCARD
+        if number[:4] == "6011" or number[:2] == "65":
+            return _DISCOVER
+    elif length == 15:
+        if number[:2] in _AMEX_PREFIXES:
+            return _AMEX
+    else:  # 13 or 19
+        if number[0] == "4":
+            return _VISA
+    return _UNKNOWN_ISSUER
 
 
 # ---------------------------------------
@@ -67,7 +72,7 @@ def validate_cvv(cvv, issuer):
     if not cvv.isdigit():
         return False
     
-    if issuer == "American Express":
+    if issuer == _AMEX:
         return len(cvv) == 4
     else:
         return len(cvv) == 3
@@ -76,7 +81,22 @@ def validate_cvv(cvv, issuer):
 # ---------------------------------------
 # 4. EXPIRY DATE VALIDATION
 # ---------------------------------------
-def validate_expiry(expiry):
+# Expiry only needs (year, month), so the wall clock is read at most once a
+# minute: (year, month, time.monotonic() of the last read). The tuple is
+# replaced in one assignment so threads never see a mixed year and month.
+_year_month_cache = (0, 0, float("-inf"))
+
+def _current_year_month():
+    global _year_month_cache
+    year, month, read_at = _year_month_cache
+    now_monotonic = time.monotonic()
+    if now_monotonic - read_at > 60:
+        now = datetime.now()
+        year, month = now.year, now.month
+        _year_month_cache = (year, month, now_monotonic)
+    return year, month
+
+def validate_expiry(expiry, current_year, current_month):
     # Check format MM/YY
     if len(expiry) != 5 or expiry[2] != '/':
         return False
@@ -84,19 +104,20 @@ def validate_expiry(expiry):
     month_part = expiry[:2]
     year_part = expiry[3:]
     
-    if not (month_part.isdigit() and year_part.isdigit()):
+    if not (expiry.isascii() and month_part.isdigit() and year_part.isdigit()):
         return False
     
-    month = int(month_part)
-    year = int("20" + year_part) 
+    # Both parts are two ASCII digits, so compute them directly instead of
+    # going through int() and a "20" + year_part concatenation
+    month = (ord(month_part[0]) - 48) * 10 + (ord(month_part[1]) - 48)
+    year = 2000 + (ord(year_part[0]) - 48) * 10 + (ord(year_part[1]) - 48)
     
     if month < 1 or month > 12:
         return False
     
-    now = datetime.now()
-    if year > now.year:
+    if year > current_year:
         return True
-    if year == now.year and month >= now.month:
+    if year == current_year and month >= current_month:
         return True
     return False
 
@@ -105,81 +126,158 @@ def validate_expiry(expiry):
 # 5. NAME VALIDATION
 # ---------------------------------------
 def validate_name(name):
+    if not isinstance(name, str):
+        return False
     if not (3 <= len(name) <= 40):
         return False
-    
-    for char in name:
-        if not (char.isalpha() or char == ' '):
-            return False
-    return True
+
+    # Letters and spaces only, checked in one C-level isalpha() pass
+    letters = name.replace(" ", "")
+    return not letters or letters.isalpha()
 
 
 # ---------------------------------------
 # 6. MASTER VALIDATOR
 # ---------------------------------------
-def validate_card_input(card_number, cvv, expiry, name):
-    result = {
-        "card_number_valid": False,
-        "issuer": None,
-        "cvv_valid": False,
-        "expiry_valid": False,
-        "name_valid": False,
-        "overall_status": False,
-        "errors": []
-    }
+_ERR_CARD = sys.intern("Invalid card number format.")
+_ERR_CVV = sys.intern("Invalid CVV format.")
+_ERR_EXPIRY = sys.intern("Invalid or expired expiry date.")
+_ERR_NAME = sys.intern("Invalid cardholder name.")
+
+_RESULT_TEMPLATE = {
+    "card_number_valid": False,
+    "issuer": None,
+    "cvv_valid": False,
+    "expiry_valid": False,
+    "name_valid": False,
+    "overall_status": False,
+    "errors": None
+}
+
+def _add_error(result, message):
+    # The errors list is only allocated once something fails
+    if result["errors"] is None:
+        result["errors"] = []
+    result["errors"].append(message)
+
+def _finish_result(result):
+    if result["errors"] is None:
+        result["errors"] = []
+    return result
+
+# With fast=True validation stops at the first failing field.
+def _validate_card_input_fields(card_number, cvv, expiry, name, current_year, current_month, fast):
+    result = _RESULT_TEMPLATE.copy()
 
-    # Card number
-    if dfa_validate_card_number(card_number):
+    # Card number: a recognised issuer already implies valid digits and
+    # length, so the DFA only runs for numbers no issuer claims
+    issuer = detect_card_issuer(card_number)
+    if issuer != _UNKNOWN_ISSUER:
         result["card_number_valid"] = True
-        result["issuer"] = detect_card_issuer(card_number)
-        if result["issuer"] == "Unknown":
-            result["card_number_valid"] = False
-            result["errors"].append("Invalid card number format.")
+        result["issuer"] = issuer
     else:
-        result["errors"].append("Invalid card number format.")
+        if dfa_validate_card_number(card_number):
+            result["issuer"] = issuer
+        _add_error(result, _ERR_CARD)
+        if fast:
+            return _finish_result(result)
 
     # CVV
     if validate_cvv(cvv, result["issuer"]):
         result["cvv_valid"] = True
     else:
-        result["errors"].append("Invalid CVV format.")
+        _add_error(result, _ERR_CVV)
+        if fast:
+            return _finish_result(result)
 
     # Expiry
-    if validate_expiry(expiry):
+    if validate_expiry(expiry, current_year, current_month):
         result["expiry_valid"] = True
     else:
-        result["errors"].append("Invalid or expired expiry date.")
+        _add_error(result, _ERR_EXPIRY)
+        if fast:
+            return _finish_result(result)
 
     # Name
     if validate_name(name):
         result["name_valid"] = True
     else:
-        result["errors"].append("Invalid cardholder name.")
+        _add_error(result, _ERR_NAME)
 
     # Final status
     if result["card_number_valid"] and result["cvv_valid"] and result["expiry_valid"] and result["name_valid"]:
         result["overall_status"] = True
 
-    return result
+    return _finish_result(result)
+
+
+def validate_card_input(card_number, cvv, expiry, name, fast=False):
+    current_year, current_month = _current_year_month()
+    return _validate_card_input_fields(card_number, cvv, expiry, name, current_year, current_month, fast)
 
 
 # ------------------------------------------------
 # 7. FLASK ROUTE FOR FRONTEND INTEGRATION
 # ------------------------------------------------
 
+# JSON routes parse and emit with orjson directly instead of going
+# through request.json / jsonify()
+def _json_body():
+    # Every JSON route takes an object; anything else is a client error
+    try:
+        data = orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        abort(400)
+    if not isinstance(data, dict):
+        abort(400)
+    return data
+
+def _json_response(obj):
+    return app.response_class(orjson.dumps(obj), mimetype="application/json")
+
 @app.route("/")
 def home():
     return render_template("index.html")
 
 @app.route("/validate-card", methods=["POST"])
 def validate_card():
-    data = request.json
+    data = _json_body()
     card_number = data.get("card_number", "")
     cvv = data.get("cvv", "")
     expiry = data.get("expiry", "")
     name = data.get("name", "")
-    result = validate_card_input(card_number, cvv, expiry, name)
-    return jsonify(result)
+    # ?fast=1 skips the remaining fields once one is invalid
+    fast = request.args.get("fast") == "1"
+    result = validate_card_input(card_number, cvv, expiry, name, fast)
+    return _json_response(result)
+
+_MAX_BATCH_CARDS = 100
+_CARD_FIELDS = ("card_number", "cvv", "expiry", "name")
+
+@app.route("/validate-cards", methods=["POST"])
+def validate_cards():
+    # Batch form of /validate-card: {"cards": [{...}, ...]} -> {"results": [...]}
+    data = _json_body()
+    cards = data.get("cards", [])
+    if not isinstance(cards, list):
+        abort(400)
+    if len(cards) > _MAX_BATCH_CARDS:
+        abort(413)
+    # Each card is a dict of string fields; missing fields default to ""
+    batch = []
+    for card in cards:
+        if not isinstance(card, dict):
+            abort(400)
+        fields = [card.get(field, "") for field in _CARD_FIELDS]
+        if not all(isinstance(value, str) for value in fields):
+            abort(400)
+        batch.append(fields)
+    fast = request.args.get("fast") == "1"
+    results = [
+        validate_card_input(card_number, cvv, expiry, name, fast)
+        for card_number, cvv, expiry, name in batch
+    ]
+    return _json_response({"results": results})
 
 @app.route("/test")
 def test():
@@ -195,7 +293,7 @@ def test():
         sample_data["expiry"],
         sample_data["name"]
     )
-    return jsonify(result)
+    return _json_response(result)
 
 
 if __name__ == "__main__":